@@ -5,15 +5,16 @@ from inspect import isclass
 from typing import Callable, TypeVar, Generic, Any, get_origin, get_args
 
 from httpx import Client, AsyncClient
+from pydantic import BaseModel
 from typing_extensions import Self
 
 from sensei._utils import normalize_url
-from sensei.types import IResponse, BaseClient
+from sensei.types import BaseClient
 from ._endpoint import Endpoint, ResponseModel, RESPONSE_TYPES
 from ._requester import Requester
 from ._types import IRouter, Hooks
 from .args import Args
-from ..tools import HTTPMethod, args_to_kwargs, MethodType
+from ..tools import HTTPMethod, bind_args, MethodType
 from ..tools.utils import is_coroutine_function, identical
 
 _Client = TypeVar('_Client', bound=BaseClient)
@@ -23,11 +24,13 @@ _RequestArgs = tuple[tuple[Any, ...], dict[str, Any]]
 class _CallableHandler(Generic[_Client]):
     __slots__ = (
         '_func',
+        '_signature',
+        '_endpoints',
         '_method',
         '_path',
         '_request_args',
         '_method_type',
-        '_temp_client',
+        '_instance',
         '_response_finalizer',
         '_preparer',
         '_case_converters',
@@ -45,64 +48,67 @@ class _CallableHandler(Generic[_Client]):
             request_args: _RequestArgs,
             method_type: MethodType,
             hooks: Hooks,
+            instance: object | None = None,
+            signature: inspect.Signature | None = None,
+            endpoints: dict[tuple, Endpoint] | None = None,
             skip_preparer: bool = False,
             skip_finalizer: bool = False,
     ):
         self._func = func
+        self._signature = inspect.signature(func) if signature is None else signature
+        self._endpoints = {} if endpoints is None else endpoints
         self._router = router
         self._method = method
         self._path = path
 
         self._request_args = request_args
         self._method_type = method_type
-        self._temp_client: _Client | None = None
+        self._instance = instance
         self._case_converters = hooks.case_converters
 
-        if skip_preparer:
-            hooks.prepare_args = identical
-
-        if skip_finalizer:
-            hooks.finalize_json = identical
-
         post_preparer = hooks.post_preparer
-        pre_preparer = hooks.prepare_args
+        pre_preparer = identical if skip_preparer else hooks.prepare_args
 
-        json_finalizer = hooks.finalize_json
-        response_finalizer = hooks.response_finalizer
+        json_finalizer = identical if skip_finalizer else hooks.finalize_json
 
-        if is_coroutine_function(post_preparer):
+        if pre_preparer is identical:
+            preparer = post_preparer
+        elif post_preparer is identical:
+            preparer = pre_preparer
+        elif is_coroutine_function(post_preparer):
             async def preparer(value: Args) -> Args:
                 return await post_preparer(pre_preparer(value))
         else:
             def preparer(value: Args) -> Args:
                 return post_preparer(pre_preparer(value))
 
-        if response_finalizer:
-            if is_coroutine_function(response_finalizer):
-                async def finalizer(value: IResponse) -> ResponseModel:
-                    return await response_finalizer(value)
-            else:
-                def finalizer(value: IResponse) -> ResponseModel:
-                    return response_finalizer(value)
-        else:
-            finalizer = response_finalizer
-
         self._preparer = preparer
-        self._response_finalizer = finalizer
+        self._response_finalizer = hooks.response_finalizer
 
         self._json_finalizer = json_finalizer
 
     def __make_endpoint(self) -> Endpoint:
-        params = {}
-        func = self._func
         method_type = self._method_type
-        sig = inspect.signature(func)
+        sig = self._signature
+
+        return_type = self.__get_return_type(sig)
 
-        args = sig.parameters.values()
+        cacheable = not isinstance(return_type, BaseModel)
+        key = (method_type, return_type)
 
+        if cacheable:
+            try:
+                endpoint = self._endpoints.get(key)
+            except TypeError:
+                cacheable = False
+            else:
+                if endpoint is not None:
+                    return endpoint
+
+        params = {}
         skipped = False
 
-        for param in args:
+        for param in sig.parameters.values():
             if MethodType.self_method(method_type) and not skipped:
                 skipped = True
                 continue
@@ -112,11 +118,26 @@ class _CallableHandler(Generic[_Client]):
             else:
                 params[param.name] = param.annotation
 
+        endpoint = Endpoint(
+            self._path,
+            self._method,
+            params=params,
+            response=return_type,
+            case_converters=self._case_converters,
+        )
+
+        if cacheable:
+            self._endpoints[key] = endpoint
+
+        return endpoint
+
+    def __get_return_type(self, sig: inspect.Signature) -> Any:
+        method_type = self._method_type
         return_type = sig.return_annotation if sig.return_annotation is not inspect.Signature.empty else None
 
         old_single_self = False
         old_list_self = False
-        func_self = getattr(func, '__self__', None)
+        func_self = self._instance
         is_list = get_origin(return_type) is list
 
         single_list = list_elem = False
@@ -139,25 +160,18 @@ class _CallableHandler(Generic[_Client]):
         if not Endpoint.is_response_type(return_type):
             if return_type is Self or old_single_self:
                 if MethodType.self_method(method_type):
-                    return_type = func.__self__  # type: ignore
+                    return_type = func_self
                 else:
                     raise ValueError('Response "Self" is only for instance and class methods')
             elif (is_list and single_list and list_elem is Self) or old_list_self:
                 if method_type is MethodType.CLASS:
-                    return_type = list[func.__self__]  # type: ignore
+                    return_type = list[func_self]  # type: ignore
                 else:
                     raise ValueError('Response "list[Self]" is only for class methods')
             elif self._response_finalizer is None:
                 raise ValueError(f'Response finalizer must be set, if response is not from: {RESPONSE_TYPES}')
 
-        endpoint = Endpoint(
-            self._path,
-            self._method,
-            params=params,
-            response=return_type,
-            case_converters=self._case_converters,
-        )
-        return endpoint
+        return return_type
 
     def _make_requester(self, client: BaseClient) -> Requester:
         endpoint = self.__make_endpoint()
@@ -177,7 +191,7 @@ class _CallableHandler(Generic[_Client]):
             raise ValueError('Client base url must be equal to Router base url')
 
         requester = self._make_requester(client)
-        kwargs = args_to_kwargs(self._func, *self._request_args[0], **self._request_args[1])
+        kwargs = bind_args(self._signature, *self._request_args[0], **self._request_args[1])
 
         method_type = self._method_type
 
@@ -188,7 +202,7 @@ class _CallableHandler(Generic[_Client]):
 
 
 class AsyncCallableHandler(_CallableHandler[AsyncClient], Generic[ResponseModel]):
-    async def __aenter__(self) -> ResponseModel:
+    async def run(self) -> ResponseModel:
         router = self._router
         manager = router.manager
 
@@ -196,25 +210,17 @@ class AsyncCallableHandler(_CallableHandler[AsyncClient], Generic[ResponseModel]
         if manager is not None:
             client = manager.get(is_async=True)
 
-        if manager is None or client is None:
-            client = AsyncClient(base_url=self._router.base_url)
-            await client.__aenter__()
-            self._temp_client = client
-        else:
-            client = manager.get(True)
-
-        requester, kwargs = self._get_request_args(client)
-
-        return await requester.request(**kwargs)
+        if client is not None:
+            requester, kwargs = self._get_request_args(client)
+            return await requester.request(**kwargs)
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if client := self._temp_client:
-            await client.__aexit__(exc_type, exc_val, exc_tb)
-            self._temp_client = None
+        async with AsyncClient(base_url=router.base_url) as client:
+            requester, kwargs = self._get_request_args(client)
+            return await requester.request(**kwargs)
 
 
 class CallableHandler(_CallableHandler[Client], Generic[ResponseModel]):
-    def __enter__(self) -> ResponseModel:
+    def run(self) -> ResponseModel:
         router = self._router
         manager = router.manager
 
@@ -222,18 +228,10 @@ class CallableHandler(_CallableHandler[Client], Generic[ResponseModel]):
         if manager is not None:
             client = manager.get()
 
-        if manager is None or client is None:
-            client = Client(base_url=self._router.base_url)
-            client.__enter__()
-            self._temp_client = client
-        else:
-            client = manager.get()
-
-        requester, kwargs = self._get_request_args(client)
-
-        return requester.request(**kwargs)
+        if client is not None:
+            requester, kwargs = self._get_request_args(client)
+            return requester.request(**kwargs)
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if client := self._temp_client:
-            client.__exit__(exc_type, exc_val, exc_tb)
-            self._temp_client = None
+        with Client(base_url=router.base_url) as client:
+            requester, kwargs = self._get_request_args(client)
+            return requester.request(**kwargs)
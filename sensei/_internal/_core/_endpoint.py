@@ -12,7 +12,7 @@ from sensei._utils import format_str
 from sensei.types import IResponse
 from ._params import Query, Body, Form, File, Cookie, Header, Param
 from .args import Args
-from ..tools import ChainedMap, accept_body, HTTPMethod
+from ..tools import accept_body, HTTPMethod, identical
 from ..tools import split_params, make_model, validate_method
 
 _CaseConverter = Callable[[str], str]
@@ -46,6 +46,25 @@ class _RequestParams(TypedDict, total=False):
     files: dict[str, Any]
 
 
+_annotation_to_label: dict[type[Param], str] = {
+    Query: 'params',
+    Body: 'json',
+    Form: 'data',
+    File: 'files',
+    Cookie: 'cookies',
+    Header: 'headers',
+}
+
+_label_to_converter: dict[str, str] = {
+    'params': 'query_case',
+    'json': 'body_case',
+    'data': 'body_case',
+    'files': 'body_case',
+    'cookies': 'cookie_case',
+    'headers': 'header_case',
+}
+
+
 class ParamsParser:
     def __init__(self, method: HTTPMethod, case_converters: _CaseConverters):
         self._method = method
@@ -65,31 +84,12 @@ class ParamsParser:
             'files': {}
         }
 
-        annotation_to_label = {
-            Query: 'params',
-            Body: 'json',
-            Form: 'data',
-            File: 'files',
-            Cookie: 'cookies',
-            Header: 'headers',
+        case_converters = self._case_converters
+        type_to_converter = {
+            param_type: case_converters[_label_to_converter[label]]
+            for param_type, label in _annotation_to_label.items()
         }
 
-        label_to_converter = {
-            'params': 'query_case',
-            'json': 'body_case',
-            'data': 'body_case',
-            'files': 'body_case',
-            'cookies': 'cookie_case',
-            'headers': 'header_case',
-        }
-
-        type_to_converter = ChainedMap[type[Param], _CaseConverter](
-            annotation_to_label,
-            label_to_converter,
-            self._case_converters
-        )
-        type_to_params = ChainedMap[type[Param], dict[str, Any]](annotation_to_label, new_params)
-
         has_body = False
         has_file_body = False
         has_not_embed = False
@@ -138,11 +138,12 @@ class ParamsParser:
 
                 param_type = type(value)
 
-                converter = type_to_converter[param_type]
-                converted = converter(key)
-
                 alias = value.alias
-                result_key = alias if alias else converted
+                if alias:
+                    result_key = alias
+                else:
+                    converter = type_to_converter[param_type]
+                    result_key = key if converter is identical else converter(key)
 
                 if condition:
                     if not value.embed:
@@ -170,12 +171,13 @@ class ParamsParser:
                         has_embed = True
                         new_params[new_params_key][result_key] = params[key]
                 else:
-                    type_to_params[param_type][result_key] = params[key]
+                    new_params[_annotation_to_label[param_type]][result_key] = params[key]
             else:
                 param_type = Body if accept_body(self._method) else Query
 
-                converted = type_to_converter[param_type](key)
-                type_to_params[param_type][converted] = params[key]
+                converter = type_to_converter[param_type]
+                converted = key if converter is identical else converter(key)
+                new_params[_annotation_to_label[param_type]][converted] = params[key]
 
         new_params = {k: v for k, v in new_params.items() if v}
         return new_params
@@ -188,6 +190,7 @@ class Endpoint(Generic[ResponseModel]):
         "_parser",
         "_params_model",
         "_response_model",
+        "_response_handler",
     )
 
     _response_handle_map: dict[_ConditionChecker, _ResponseHandler] = {
@@ -226,6 +229,7 @@ class Endpoint(Generic[ResponseModel]):
 
         self._params_model = params_model
         self._response_model = response
+        self._response_handler: _PartialHandler | None = None
         self._parser = ParamsParser(method, case_converters)
 
     @property
@@ -295,7 +299,7 @@ class Endpoint(Generic[ResponseModel]):
             url = path
             request_params = {}
 
-        return Args(
+        return Args.model_construct(
             url=url,
             **request_params
         )
@@ -303,7 +307,11 @@ class Endpoint(Generic[ResponseModel]):
     def get_response(self, *, response_obj: IResponse) -> ResponseModel | None:
         response_model = self.response_model
 
-        result = self._handle_if_condition(response_model)(response_obj)
+        handler = self._response_handler
+        if handler is None:
+            handler = self._response_handler = self._handle_if_condition(response_model)
+
+        result = handler(response_obj)
 
         to_validate = result
 
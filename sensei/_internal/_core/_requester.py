@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-import inspect
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Generic, Any
 
 from httpx import Client, AsyncClient, Response
 
 from sensei._utils import placeholders
-from sensei.client.rate_limiter import AsyncRateLimiter, RateLimiter
 from sensei.types import IResponse, Json, BaseClient, IRateLimit
 from ._endpoint import Endpoint, Args, ResponseModel
 from ._types import JsonFinalizer, ResponseFinalizer, Preparer, CaseConverters, CaseConverter
 from ..tools import identical
+from ..tools.utils import is_coroutine_function
 
 
-class _DecoratedResponse(IResponse):
+class _DecoratedResponse:
+    """
+    Response passed to finalizers and response handling on every route. Transparent proxy over `httpx.Response`:
+    attributes and `isinstance` checks resolve against the wrapped response, only `json()` applies the response case
+    and the JSON finalizer.
+    """
+
     __slots__ = (
         "_response",
         "_json_finalizer",
@@ -31,31 +37,46 @@ class _DecoratedResponse(IResponse):
         self._json_finalizer = json_finalizer
         self._response_case = response_case
 
-    def __getattribute__(self, attr: str) -> Any:
-        if attr not in ('json', '_response', '_json_finalizer', '_response_case'):
-            return getattr(self._response, attr)
-        else:
-            return super().__getattribute__(attr)
+    text = property(attrgetter('_response.text'))
+    content = property(attrgetter('_response.content'))
+    status_code = property(attrgetter('_response.status_code'))
+    headers = property(attrgetter('_response.headers'))
+    request = property(attrgetter('_response.request'))
+
+    @property
+    def __class__(self) -> type:
+        return type(self._response)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._response, attr)
 
     def json(self) -> Json:
         case = self._response_case
-        json = self._response.json()
-        json = {case(k): v for k, v in json.items()}
-        return self._json_finalizer(json)
+        json_finalizer = self._json_finalizer
+        response = self._response
+        json = response.json()
+
+        if case is not identical:
+            json = {case(k): v for k, v in json.items()}
+
+        if json_finalizer is identical:
+            return json
+
+        return json_finalizer(json)
 
 
 class Requester(ABC, Generic[ResponseModel]):
     __slots__ = (
         "_client",
-        "_post_preparer",
         "_response_finalizer",
         "_endpoint",
+        "_method",
         "_json_finalizer",
         "_preparer",
         "_rate_limit",
         "_is_async_preparer",
         "_is_async_response_finalizer",
-        "_case_converters"
+        "_response_case",
     )
 
     def __new__(
@@ -68,14 +89,17 @@ class Requester(ABC, Generic[ResponseModel]):
             response_finalizer: ResponseFinalizer | None = None,
             json_finalizer: JsonFinalizer = identical,
             preparer: Preparer = identical,
-            response_case: CaseConverter = identical,
     ):
-        if isinstance(client, AsyncClient):
-            return super().__new__(_AsyncRequester)
-        elif isinstance(client, Client):
-            return super().__new__(_Requester)
-        else:
-            raise ValueError("Client must be an instance of AsyncClient or Client")
+        requester_cls = _requesters.get(type(client))
+
+        if requester_cls is None:
+            for client_cls, requester_cls in _requesters.items():
+                if isinstance(client, client_cls):
+                    break
+            else:
+                raise ValueError("Client must be an instance of AsyncClient or Client")
+
+        return super().__new__(requester_cls)
 
     def __init__(
             self,
@@ -92,12 +116,13 @@ class Requester(ABC, Generic[ResponseModel]):
 
         self._response_finalizer = response_finalizer or self._finalize
         self._endpoint = endpoint
+        self._method = endpoint.method
         self._json_finalizer = json_finalizer
         self._preparer = preparer
         self._rate_limit = rate_limit
-        self._is_async_preparer = inspect.iscoroutinefunction(self._preparer)
-        self._is_async_response_finalizer = inspect.iscoroutinefunction(self._response_finalizer)
-        self._case_converters = case_converters
+        self._is_async_preparer = is_coroutine_function(self._preparer)
+        self._is_async_response_finalizer = is_coroutine_function(self._response_finalizer)
+        self._response_case = case_converters['response_case']
 
     def _finalize(self, response: IResponse) -> ResponseModel:
         endpoint = self._endpoint
@@ -107,31 +132,26 @@ class Requester(ABC, Generic[ResponseModel]):
     def request(self, **kwargs) -> ResponseModel:
         pass
 
+    def _decorate_response(self, response: Response) -> IResponse:
+        return _DecoratedResponse(response, json_finalizer=self._json_finalizer, response_case=self._response_case)
+
     def _dump_args(self, args: Args) -> dict[str, Any]:
-        endpoint = self._endpoint
         args = args.model_dump(mode="json", exclude_none=True, by_alias=True)
         if placeholders(url := args['url']):
             raise ValueError(f'Path params of {url} params must be passed')
-        return {'method': endpoint.method, **args}
+        args['method'] = self._method
+        return args
 
 
 class _AsyncRequester(Requester):
-    async def _call_preparer(self, args: Args) -> Args:
-        result = self._preparer(args)
-        if self._is_async_preparer:
-            result = await result
-        return result
-
-    async def _call_response_finalizer(self, response: IResponse) -> ResponseModel:
-        result = self._response_finalizer(response)
-        if self._is_async_response_finalizer:
-            result = await result
-        return result
-
     async def _get_args(self, **kwargs) -> dict[str, Any]:
         endpoint = self._endpoint
         args = endpoint.get_args(**kwargs)
-        args = await self._call_preparer(args)
+        preparer = self._preparer
+        if preparer is not identical:
+            args = preparer(args)
+            if self._is_async_preparer:
+                args = await args
         return self._dump_args(args)
 
     async def request(self, **kwargs) -> ResponseModel:
@@ -140,13 +160,15 @@ class _AsyncRequester(Requester):
 
         rate_limit = self._rate_limit
         if rate_limit:
-            await AsyncRateLimiter(rate_limit).wait_for_slot()
+            await rate_limit.async_wait_for_slot()
 
         response = await client.request(**args)
-        response.raise_for_status()
-        case = self._case_converters['response_case']
-        response = _DecoratedResponse(response, json_finalizer=self._json_finalizer, response_case=case)
-        response = await self._call_response_finalizer(response)
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        response = self._decorate_response(response)
+        response = self._response_finalizer(response)
+        if self._is_async_response_finalizer:
+            response = await response
         self._endpoint.validate_response(response)
         return response
 
@@ -167,7 +189,8 @@ class _Requester(Requester):
     def _get_args(self, **kwargs) -> dict[str, Any]:
         endpoint = self._endpoint
         args = endpoint.get_args(**kwargs)
-        args = self._call_preparer(args)
+        if self._preparer is not identical:
+            args = self._call_preparer(args)
         return self._dump_args(args)
 
     def request(self, **kwargs) -> ResponseModel:
@@ -176,12 +199,18 @@ class _Requester(Requester):
 
         rate_limit = self._rate_limit
         if rate_limit:
-            RateLimiter(rate_limit).wait_for_slot()
+            rate_limit.wait_for_slot()
 
         response = client.request(**args)
-        response.raise_for_status()
-        case = self._case_converters['response_case']
-        response = _DecoratedResponse(response, json_finalizer=self._json_finalizer, response_case=case)
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        response = self._decorate_response(response)
         response = self._call_response_finalizer(response)
         self._endpoint.validate_response(response)
         return response
+
+
+_requesters: dict[type[BaseClient], type[Requester]] = {
+    AsyncClient: _AsyncRequester,
+    Client: _Requester,
+}
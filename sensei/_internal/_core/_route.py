@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import inspect
+import sys
 from abc import ABC, abstractmethod
-from functools import wraps, partial
+from functools import update_wrapper, partial
+from inspect import signature, iscoroutinefunction
 from typing import Callable
 
 from ._callable_handler import CallableHandler, AsyncCallableHandler
@@ -11,42 +12,41 @@ from ._types import IRouter, Hooks
 from ..tools import HTTPMethod, MethodType
 
 
+def make_route(
+        path: str,
+        method: HTTPMethod,
+        router: IRouter,
+        *,
+        func: Callable,
+        hooks: Hooks,
+        skip_preparer: bool = False,
+        skip_finalizer: bool = False,
+) -> Route:
+    route_cls = _AsyncRoute if iscoroutinefunction(func) else _SyncRoute
+    return route_cls(
+        path,
+        method,
+        router,
+        func=func,
+        hooks=hooks,
+        skip_preparer=skip_preparer,
+        skip_finalizer=skip_finalizer,
+    )
+
+
 class Route(ABC):
+    _is_async: bool
+    _handler_cls: type[CallableHandler] | type[AsyncCallableHandler]
+
     __slots__ = (
         '_path',
         '_method',
-        '_func',
         '_method_type',
-        '_is_async',
         '__self__',
-        '_router',
         '_hooks',
-        '_skip_preparer',
-        '_skip_finalizer'
+        '_make_handler'
     )
 
-    def __new__(
-            cls,
-            path: str,
-            method: HTTPMethod,
-            router: IRouter,
-            *,
-            func: Callable,
-            hooks: Hooks,
-            skip_preparer: bool = False,
-            skip_finalizer: bool = False,
-    ):
-        if inspect.iscoroutinefunction(func):
-            instance = super().__new__(_AsyncRoute)
-            is_async = True
-        else:
-            instance = super().__new__(_SyncRoute)
-            is_async = False
-
-        instance._is_async = is_async
-
-        return instance
-
     def __init__(
             self,
             path: str,
@@ -58,19 +58,29 @@ class Route(ABC):
             skip_preparer: bool = False,
             skip_finalizer: bool = False,
     ):
+        path = sys.intern(path)
+
         self._path = path
         self._method = method
-        self._func = func
-        self._router = router
-
         self._hooks = hooks
-        self._skip_preparer = skip_preparer
-        self._skip_finalizer = skip_finalizer
 
         self._method_type: MethodType = MethodType.STATIC
 
         self.__self__: object | None = None
 
+        self._make_handler = partial(
+            self._handler_cls,
+            func=func,
+            router=router,
+            path=path,
+            method=method,
+            hooks=hooks,
+            signature=signature(func),
+            endpoints={},
+            skip_preparer=skip_preparer,
+            skip_finalizer=skip_finalizer,
+        )
+
     @property
     def path(self) -> str:
         return self._path
@@ -93,26 +103,22 @@ class Route(ABC):
 
     @method_type.setter
     def method_type(self, value: MethodType):
-        if isinstance(value, MethodType):
-            self._method_type = value
-        else:
-            raise TypeError(f'Method type must be an instance of {MethodType}')
+        self._method_type = value
 
     @property
     def hooks(self) -> Hooks:
         return self._hooks
 
     def _get_wrapper(self, func: Callable[..., ...]):
-        @wraps(func)
         def wrapper(*args, **kwargs):
-            new_func = func
+            instance = self.__self__
 
-            if self.__self__ is not None:
-                new_func = partial(func, self.__self__)
+            if instance is not None:
+                return func(instance, *args, **kwargs)
 
-            return new_func(*args, **kwargs)
+            return func(*args, **kwargs)
 
-        return wrapper
+        return update_wrapper(wrapper, func, assigned=('__name__',), updated=())
 
     def finalize(self, func: ResponseFinalizer | None = None) -> Callable:
         """
@@ -124,14 +130,15 @@ class Route(ABC):
         Returns:
             ResponseFinalizer: Wrapped function, used to finalize response
         """
-        def decorator(func: ResponseFinalizer) -> ResponseFinalizer:
-            self._hooks.response_finalizer = self._get_wrapper(func)
-            return func
-
         if func is None:
+            def decorator(func: ResponseFinalizer) -> ResponseFinalizer:
+                self._hooks.response_finalizer = self._get_wrapper(func)
+                return func
+
             return decorator
-        else:
-            return decorator(func)
+
+        self._hooks.response_finalizer = self._get_wrapper(func)
+        return func
 
     def prepare(self, func: Preparer | None = None) -> Callable:
         """
@@ -144,43 +151,42 @@ class Route(ABC):
         Returns:
             Preparer: Wrapped function, used to prepare the args for request before it
         """
-        def decorator(func: Preparer) -> Preparer:
-            self._hooks.post_preparer = self._get_wrapper(func)
-            return func
-
         if func is None:
+            def decorator(func: Preparer) -> Preparer:
+                self._hooks.post_preparer = self._get_wrapper(func)
+                return func
+
             return decorator
-        else:
-            return decorator(func)
+
+        self._hooks.post_preparer = self._get_wrapper(func)
+        return func
 
 
 class _SyncRoute(Route):
+    __slots__ = ()
+
+    _is_async = False
+    _handler_cls = CallableHandler
+
     def __call__(self, *args, **kwargs):
-        with CallableHandler(
-            func=self._func,
-            router=self._router,
+        handler = self._make_handler(
             request_args=(args, kwargs),
             method_type=self._method_type,
-            path=self.path,
-            method=self._method,
-            hooks=self._hooks,
-            skip_preparer=self._skip_preparer,
-            skip_finalizer=self._skip_finalizer,
-        ) as response:
-            return response
+            instance=self.__self__,
+        )
+        return handler.run()
 
 
 class _AsyncRoute(Route):
+    __slots__ = ()
+
+    _is_async = True
+    _handler_cls = AsyncCallableHandler
+
     async def __call__(self, *args, **kwargs):
-        async with AsyncCallableHandler(
-            func=self._func,
-            router=self._router,
+        handler = self._make_handler(
             request_args=(args, kwargs),
             method_type=self._method_type,
-            path=self.path,
-            method=self._method,
-            hooks=self._hooks,
-            skip_preparer=self._skip_preparer,
-            skip_finalizer=self._skip_finalizer,
-        ) as response:
-            return response
+            instance=self.__self__,
+        )
+        return await handler.run()
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import sys
+from collections import ChainMap
 from abc import abstractmethod, ABC
 from enum import Enum
-from typing import Protocol, TypeVar, Callable, Any, Mapping, Union, Awaitable, Literal, get_args, Optional
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Protocol, TypeVar, Callable, Any, Mapping, Union, Awaitable, Literal, get_args, Optional, Iterator
+)
 
-from httpx import URL
-from pydantic import validate_call, BaseModel, ConfigDict
-from typing_extensions import Self, TypeGuard
+from pydantic import TypeAdapter
+from typing_extensions import TypeGuard
 
-from sensei.client import Manager
-from sensei.types import IRateLimit, Json
+from sensei.types import Json, IResponse
 from .args import Args
 from ..tools import MethodType, identical, HTTPMethod
 
+if TYPE_CHECKING:
+    from httpx import URL
+    from sensei.client import Manager
+    from sensei.types import IRateLimit
+
 CaseConverter = Callable[[str], str]
 
 _RT = TypeVar('_RT')
@@ -150,55 +158,19 @@ class RoutedFunction(Callable[..., _RT]):
     __sensei_routed_function__: bool = True
 
 
-class IRequest(Protocol):
-    @property
-    def headers(self) -> Mapping[str, Any]:
-        pass
-
-    @property
-    def method(self) -> str:
-        pass
-
-    @property
-    def url(self) -> Any:
-        pass
-
-
-class IResponse(Protocol):
+class IRouter:
     __slots__ = ()
 
-    def __await__(self):
-        pass
-
-    def json(self) -> Json:
-        pass
-
-    def raise_for_status(self) -> Self:
-        pass
-
-    @property
-    def request(self) -> IRequest:
-        pass
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-    @property
-    def text(self) -> str:
-        pass
+        abstract = sorted(
+            name for name in dir(cls)
+            if getattr(getattr(cls, name, None), '__isabstractmethod__', False)
+        )
 
-    @property
-    def status_code(self) -> int:
-        pass
-
-    @property
-    def content(self) -> bytes:
-        pass
-
-    @property
-    def headers(self) -> Mapping[str, Any]:
-        pass
-
-
-class IRouter(ABC):
-    __slots__ = ()
+        if abstract:
+            raise TypeError(f'Class {cls.__name__} must implement abstract members: {", ".join(abstract)}')
 
     @property
     @abstractmethod
@@ -221,91 +193,29 @@ class IRouter(ABC):
         pass
 
     @abstractmethod
-    def get(
-            self,
-            path: str,
-            /, *,
-            query_case: CaseConverter | None = None,
-            cookie_case: CaseConverter | None = None,
-            header_case: CaseConverter | None = None,
-            skip_finalizer: bool = False,
-    ) -> RoutedFunction:
+    def _route(self, method: HTTPMethod, path: str, /, **kwargs) -> RoutedFunction:
         pass
 
-    @abstractmethod
-    def post(
-            self,
-            path: str,
-            /, *,
-            query_case: CaseConverter | None = None,
-            body_case: CaseConverter | None = None,
-            cookie_case: CaseConverter | None = None,
-            header_case: CaseConverter | None = None,
-            skip_finalizer: bool = False,
-    ) -> RoutedFunction:
-        pass
+    def get(self, path: str, /, **kwargs) -> RoutedFunction:
+        return self._route('GET', path, **kwargs)
 
-    @abstractmethod
-    def patch(
-            self,
-            path: str,
-            /, *,
-            query_case: CaseConverter | None = None,
-            body_case: CaseConverter | None = None,
-            cookie_case: CaseConverter | None = None,
-            header_case: CaseConverter | None = None,
-            skip_finalizer: bool = False,
-    ) -> RoutedFunction:
-        pass
+    def post(self, path: str, /, **kwargs) -> RoutedFunction:
+        return self._route('POST', path, **kwargs)
 
-    @abstractmethod
-    def put(
-            self,
-            path: str,
-            /, *,
-            query_case: CaseConverter | None = None,
-            body_case: CaseConverter | None = None,
-            cookie_case: CaseConverter | None = None,
-            header_case: CaseConverter | None = None,
-            skip_finalizer: bool = False,
-    ) -> RoutedFunction:
-        pass
+    def patch(self, path: str, /, **kwargs) -> RoutedFunction:
+        return self._route('PATCH', path, **kwargs)
 
-    @abstractmethod
-    def delete(
-            self,
-            path: str,
-            /, *,
-            query_case: CaseConverter | None = None,
-            cookie_case: CaseConverter | None = None,
-            header_case: CaseConverter | None = None,
-            skip_finalizer: bool = False,
-    ) -> RoutedFunction:
-        pass
+    def put(self, path: str, /, **kwargs) -> RoutedFunction:
+        return self._route('PUT', path, **kwargs)
 
-    @abstractmethod
-    def options(
-            self,
-            path: str,
-            /, *,
-            query_case: CaseConverter | None = None,
-            cookie_case: CaseConverter | None = None,
-            header_case: CaseConverter | None = None,
-            skip_finalizer: bool = False,
-    ) -> RoutedFunction:
-        pass
+    def delete(self, path: str, /, **kwargs) -> RoutedFunction:
+        return self._route('DELETE', path, **kwargs)
 
-    @abstractmethod
-    def head(
-            self,
-            path: str,
-            /, *,
-            query_case: CaseConverter | None = None,
-            cookie_case: CaseConverter | None = None,
-            header_case: CaseConverter | None = None,
-            skip_finalizer: bool = False,
-    ) -> RoutedFunction:
-        pass
+    def options(self, path: str, /, **kwargs) -> RoutedFunction:
+        return self._route('OPTIONS', path, **kwargs)
+
+    def head(self, path: str, /, **kwargs) -> RoutedFunction:
+        return self._route('HEAD', path, **kwargs)
 
     @property
     @abstractmethod
@@ -384,23 +294,38 @@ _VT = TypeVar('_VT')
 ConverterName = Literal['default_case', 'query_case', 'body_case', 'cookie_case', 'header_case', 'response_case']
 
 
-class _MappingGetter(dict[_KT, _VT]):
+class _MappingGetter(Mapping[_KT, _VT]):
+    __slots__ = ('_MappingGetter__getter',)
+
     def __init__(
             self,
             dict_getter: Callable[[], dict[_KT, _VT]]
     ):
-        __dict = dict_getter()
-        super().__init__(__dict)
         self.__getter = dict_getter
 
     def __getitem__(self, item: _KT) -> _VT:
         return self.__getter()[item]
 
-    def __setitem__(self, key: _KT, value: _VT) -> None:
-        raise TypeError(f'{self.__class__.__name__} does not support item assignment')
+    def __iter__(self) -> Iterator[_KT]:
+        return iter(self.__getter())
+
+    def __len__(self) -> int:
+        return len(self.__getter())
+
+
+_converter_names: frozenset[str] = frozenset(get_args(ConverterName))
+_converter_keys: tuple[str, ...] = ('query_case', 'body_case', 'cookie_case', 'header_case', 'response_case')
+_converters_adapter = TypeAdapter(dict[ConverterName, CaseConverter])
 
 
 class CaseConverters(_MappingGetter[ConverterName, CaseConverter]):
+    __slots__ = (
+        '_CaseConverters__router',
+        '_layers',
+        '_default_case',
+        '_cache',
+    )
+
     def __init__(
             self,
             router: IRouter,
@@ -413,7 +338,7 @@ class CaseConverters(_MappingGetter[ConverterName, CaseConverter]):
             response_case: CaseConverter | None = None,
     ):
         self.__router = router
-        self._defaults = {
+        defaults = {
             'query_case': query_case,
             'body_case': body_case,
             'cookie_case': cookie_case,
@@ -421,51 +346,61 @@ class CaseConverters(_MappingGetter[ConverterName, CaseConverter]):
             'response_case': response_case,
         }
 
-        self._sub_defaults = {}
+        self._layers = ChainMap({k: v for k, v in defaults.items() if v is not None}, {})
 
         self._default_case = default_case or router.default_case
+        self._cache: dict[str, CaseConverter] | None = None
 
-        super().__init__(self.__getter)
+        super().__init__(self.__resolve)
 
     @property
-    @validate_call(validate_return=True)
-    def defaults(self) -> dict[ConverterName, Optional[CaseConverter]]:
-        return self._sub_defaults
+    def defaults(self) -> Mapping[ConverterName, Optional[CaseConverter]]:
+        return MappingProxyType(self._layers.maps[1])
 
     @defaults.setter
-    @validate_call(validate_return=True)
     def defaults(self, value: dict[ConverterName, CaseConverter]) -> None:
-        self._sub_defaults = value
+        self._layers.maps[1] = _converters_adapter.validate_python(value)
+        self._cache = None
 
     def __setitem__(self, key, value):
-        is_default = key == 'default_case'
-        if key not in self._defaults and not is_default:
+        if key not in _converter_names:
             raise KeyError(f'{key} is not a valid key')
+        elif key == 'default_case':
+            self._default_case = value
+        elif value is None:
+            self._layers.maps[0].pop(key, None)
         else:
-            if is_default:
-                self._default_case = value
-            else:
-                self._defaults[key] = value
+            self._layers.maps[0][key] = value
+
+        self._cache = None
 
     def __getitem__(self, item: ConverterName) -> CaseConverter:
-        converter = super().__getitem__(item)
+        converter = self.__resolve()[item]
         if converter is None:
             converter = identical
 
         return converter
 
+    def __resolve(self) -> dict[str, CaseConverter]:
+        converters = self._cache
+        if converters is None:
+            converters = self._cache = self.__getter()
+
+        return converters
+
     def __getter(self) -> dict[str, CaseConverter]:
         router = self.__router
-        converters = self._defaults.copy()
+        layers = self._layers
         default = self._default_case
+        converters = {}
 
-        for key, converter in converters.items():
-            converter = converter or self.defaults.get(key)
+        for key in _converter_keys:
+            converter = layers.get(key)
             if converter is None:
-                router_converter = getattr(router, f'{key}')
-                converters[key] = default if router_converter is None else router_converter
-            else:
-                converters[key] = converter
+                router_converter = getattr(router, key)
+                converter = default if router_converter is None else router_converter
+
+            converters[key] = converter
 
         return converters
 
@@ -489,25 +424,46 @@ class ModelHook(Enum):
         return self.value.endswith("_case__")
 
 
-class Hooks(BaseModel):
-    model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
+_model_hooks_adapter = TypeAdapter(dict[ModelHook, Callable])
+_hook_meta: dict[ModelHook, tuple[str, bool]] = {
+    hook: (sys.intern(hook.value[2:-2]), hook.is_case_hook()) for hook in ModelHook
+}
+
 
-    prepare_args: Preparer = identical
-    post_preparer: Preparer = identical
-    finalize_json: JsonFinalizer = identical
-    response_finalizer: Optional[ResponseFinalizer] = None
-    case_converters: CaseConverters
+class Hooks:
+    __slots__ = (
+        'prepare_args',
+        'post_preparer',
+        'finalize_json',
+        'response_finalizer',
+        'case_converters',
+    )
+
+    def __init__(
+            self,
+            *,
+            case_converters: CaseConverters,
+            prepare_args: Preparer = identical,
+            post_preparer: Preparer = identical,
+            finalize_json: JsonFinalizer = identical,
+            response_finalizer: Optional[ResponseFinalizer] = None,
+    ):
+        self.prepare_args = prepare_args
+        self.post_preparer = post_preparer
+        self.finalize_json = finalize_json
+        self.response_finalizer = response_finalizer
+        self.case_converters = case_converters
 
     @staticmethod
     def _is_converter_name(name: str) -> TypeGuard[ConverterName]:
-        return name in get_args(ConverterName)
+        return name in _converter_names
 
-    @validate_call(validate_return=True)
     def set_model_hooks(self, hooks: dict[ModelHook, Callable]) -> None:
+        hooks = _model_hooks_adapter.validate_python(hooks)
         case_hooks = {}
         for key, value in hooks.items():
-            stripped = key.value[2:-2]
-            if key.is_case_hook():
+            stripped, is_case_hook = _hook_meta[key]
+            if is_case_hook:
                 if self._is_converter_name(stripped):
                     case_hooks[stripped] = value
                 else:
@@ -1,49 +1,38 @@
+from functools import lru_cache
 from typing import Any, Callable
 
 from pydantic import BaseModel
 from pydantic._internal._model_construction import ModelMetaclass
-from typing_extensions import TypeGuard
 
 from sensei.types import Json
-from ._types import RoutedMethod, ModelHook, RoutedFunction
+from ._types import ModelHook, RoutedFunction
 from .args import Args
-from ..tools import is_staticmethod, is_classmethod, is_instancemethod, bind_attributes, is_method
+from ..tools import is_instancemethod
+
+_hook_names: frozenset[str] = frozenset(ModelHook.values())
+_method_wrappers = (staticmethod, classmethod)
 
 
 class _Namespace(dict):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._routed_functions = set()
+        self._routed_functions: list[RoutedFunction] = []
 
     @property
-    def routed_functions(self) -> set[RoutedFunction]:
+    def routed_functions(self) -> list[RoutedFunction]:
         return self._routed_functions
 
-    @staticmethod
-    def _decorate_method(method: RoutedMethod) -> None:
-        preparer = method.__func__.prepare
-        finalizer = method.__func__.finalize
-
-        bind_attributes(method, finalizer, preparer)  # type: ignore
-
-    @staticmethod
-    def _is_routed_function(obj: Any) -> TypeGuard[RoutedMethod]:
-        cond = False
-        if is_method(obj):
-            if is_staticmethod(obj) or is_classmethod(obj):
-                obj = obj.__func__
-            cond = getattr(obj, '__sensei_routed_function__', None) is True
-        return cond
-
     def __setitem__(self, key: Any, value: Any):
-        if self._is_routed_function(value):
-            if is_staticmethod(value) or is_classmethod(value):
-                self._decorate_method(value)
-                self._routed_functions.add(value.__func__)
-            else:
-                self._routed_functions.add(value)
-        elif key in ModelHook.values():
-            if is_instancemethod(value):
+        if isinstance(value, _method_wrappers):
+            func = value.__func__
+            if getattr(func, '__sensei_routed_function__', None) is True:
+                value.finalize = func.finalize
+                value.prepare = func.prepare
+                self._routed_functions.append(func)
+        elif is_instancemethod(value):
+            if getattr(value, '__sensei_routed_function__', None) is True:
+                self._routed_functions.append(value)
+            elif key in _hook_names:
                 raise ValueError(f'Class hook {value.__name__} cannot be instance method')
 
         super().__setitem__(key, value)
@@ -266,7 +255,10 @@ class _ModelBase(BaseModel):
         Returns:
             str: String representation of the model
         """
-        return f'{self.__class__.__name__}({super().__str__()})'
+        return f'{type(self).__name__}({self.__repr_str__(" ")})'
+
+
+_base_hooks: dict[str, Callable] = {name: getattr(_ModelBase, name) for name in ModelHook.values()}
 
 
 class _ModelMeta(ModelMetaclass):
@@ -296,11 +288,12 @@ class _ModelMeta(ModelMetaclass):
     @staticmethod
     def __collect_hooks(obj: object) -> dict[ModelHook, Callable]:
         hooks = {}
-        for value in ModelHook.values():
+        for value, default in _base_hooks.items():
             hook = getattr(obj, value, None)
 
-            is_defined = hook is not getattr(_ModelBase, value, None)
-            if hook and is_defined:
+            if hook and hook is not default:
+                if value.endswith('_case__'):
+                    hook = lru_cache(maxsize=256)(hook)
                 hooks[value] = hook
         return hooks  # type: ignore
 
@@ -4,6 +4,8 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from sensei.types import Json
 
+_dump_exclude = frozenset({'files'})
+
 
 class Args(BaseModel):
     """
@@ -23,20 +25,48 @@ class Args(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
 
     url: str
-    params: dict[str, Any] = {}
-    json_: Json = Field({}, alias="json")
-    data: Any = {}
-    headers: dict[str, Any] = {}
-    cookies: dict[str, Any] = {}
-    files: dict[str, Any] = {}
-
-    def model_dump(self, *args, **kwargs) -> dict[str, Any]:
-        data = super().model_dump(*args, exclude={'files'}, **kwargs)
+    params: dict[str, Any] = Field(default_factory=dict)
+    json_: Json = Field(default_factory=dict, alias="json")
+    data: Any = Field(default_factory=dict)
+    headers: dict[str, Any] = Field(default_factory=dict)
+    cookies: dict[str, Any] = Field(default_factory=dict)
+    files: dict[str, Any] = Field(default_factory=dict)
+
+    def model_dump(self, **kwargs) -> dict[str, Any]:
+        data = self.__pydantic_serializer__.to_python(self, exclude=_dump_exclude, **kwargs)
         data['files'] = self.files
-        return self._exclude_none(data)
+        return _exclude_none(data)
+
+
+def _has_none(data: dict[str, Any]) -> bool:
+    stack = [data]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        for value in pop().values():
+            if value is None:
+                return True
+            if isinstance(value, dict):
+                push(value)
+
+    return False
+
+
+def _drop_none(data: dict[str, Any]) -> dict[str, Any]:
+    result = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        if isinstance(value, dict) and _has_none(value):
+            value = _drop_none(value)
+        result[key] = value
+
+    return result
+
+
+def _exclude_none(data: Any) -> Any:
+    if not isinstance(data, dict) or not _has_none(data):
+        return data
 
-    @classmethod
-    def _exclude_none(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if not isinstance(data, dict):
-            return data
-        return {k: cls._exclude_none(v) for k, v in data.items() if v is not None}
+    return _drop_none(data)
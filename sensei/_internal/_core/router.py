@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import wraps
-from typing import Callable, Optional, Any, TypeVar
+from typing import Callable, Optional, TypeVar
 
 from httpx import URL
 
@@ -10,7 +10,7 @@ from sensei.cases import header_case as to_header_case
 from sensei.client import Manager
 from sensei.types import IRateLimit
 from ._requester import JsonFinalizer
-from ._route import Route
+from ._route import make_route
 from ._types import IRouter, Preparer, RoutedFunction, CaseConverters, CaseConverter, Hooks
 from ..tools import HTTPMethod, set_method_type, identical, MethodType, bind_attributes
 
@@ -23,6 +23,22 @@ _RouteDecorator = Callable[[_RF], _RF]
 
 
 class Router(IRouter):
+    __slots__ = (
+        '_manager',
+        '_host',
+        '_port',
+        '_rate_limit',
+        '_default_case',
+        '_query_case',
+        '_body_case',
+        '_cookie_case',
+        '_header_case',
+        '_response_case',
+        '_finalize_json',
+        '_prepare_args',
+        '__weakref__',
+    )
+
     def __init__(
             self,
             host: str,
@@ -352,6 +368,38 @@ class Router(IRouter):
         """
         return self._response_case
 
+    def _route(
+            self,
+            method: HTTPMethod,
+            path: str,
+            /, *,
+            default_case: CaseConverter | None = None,
+            query_case: CaseConverter | None = None,
+            body_case: CaseConverter | None = None,
+            cookie_case: CaseConverter | None = None,
+            header_case: CaseConverter | None = None,
+            response_case: CaseConverter | None = None,
+            skip_finalizer: bool = False,
+            skip_preparer: bool = False,
+    ) -> _RouteDecorator:
+        converters = CaseConverters(
+            self,
+            default_case=default_case,
+            query_case=query_case,
+            body_case=body_case,
+            cookie_case=cookie_case,
+            header_case=header_case,
+            response_case=response_case,
+        )
+
+        return self._get_decorator(
+            path=path,
+            method=method,
+            case_converters=converters,
+            skip_finalizer=skip_finalizer,
+            skip_preparer=skip_preparer,
+        )
+
     def _get_decorator(
             self,
             path: str,
@@ -368,7 +416,7 @@ class Router(IRouter):
                 prepare_args=self._prepare_args,
             )
 
-            route = Route(
+            route = make_route(
                 path=path,
                 method=method,
                 router=self,
@@ -381,35 +429,33 @@ class Router(IRouter):
             func.__sensei_routed_function__ = True
             func.__route__ = route
 
-            def _setattrs(
-                    instance: Any,
-                    func: Callable,
-                    wrapper: Callable,
-                    route: Route
-            ) -> None:
-                method_type = route.method_type = wrapper.__method_type__  # type: ignore
-
-                if MethodType.self_method(method_type):
-                    route.__self__ = instance
-                    func.__self__ = instance
-
             if not route.is_async:
                 @set_method_type
                 @wraps(func)
                 def wrapper(*args, **kwargs):
-                    instance = args[0] if len(args) else None
-                    _setattrs(instance, func, wrapper, route)
+                    method_type = route.method_type = wrapper.__method_type__  # type: ignore
+                    is_self = MethodType.self_method(method_type)
+                    if is_self:
+                        route.__self__ = args[0]
+
                     res = route(*args, **kwargs)
-                    _setattrs(None, func, wrapper, route)
+
+                    if is_self:
+                        route.__self__ = None
                     return res
             else:
                 @set_method_type
                 @wraps(func)
                 async def wrapper(*args, **kwargs):
-                    instance = args[0] if len(args) else None
-                    _setattrs(instance, func, wrapper, route)
+                    method_type = route.method_type = wrapper.__method_type__  # type: ignore
+                    is_self = MethodType.self_method(method_type)
+                    if is_self:
+                        route.__self__ = args[0]
+
                     res = await route(*args, **kwargs)
-                    _setattrs(None, func, wrapper, route)
+
+                    if is_self:
+                        route.__self__ = None
                     return res
 
             bind_attributes(wrapper, route.finalize, route.prepare)  # type: ignore
@@ -461,24 +507,17 @@ class Router(IRouter):
         Raises:
             pydantic_core.ValidationError: If type validation of arguments fails.
         """
-        converters = CaseConverters(
-            self,
+        return self._route(
+            "GET",
+            path,
             default_case=default_case,
             query_case=query_case,
-            body_case=None,
             cookie_case=cookie_case,
             header_case=header_case,
             response_case=response_case,
-        )
-
-        decorator = self._get_decorator(
-            path=path,
-            method="GET",
-            case_converters=converters,
             skip_finalizer=skip_finalizer,
             skip_preparer=skip_preparer,
         )
-        return decorator
 
     def post(
             self,
@@ -527,24 +566,18 @@ class Router(IRouter):
         Raises:
             pydantic_core.ValidationError: If type validation of arguments fails.
         """
-        converters = CaseConverters(
-            self,
+        return self._route(
+            "POST",
+            path,
             default_case=default_case,
             query_case=query_case,
             body_case=body_case,
             cookie_case=cookie_case,
             header_case=header_case,
             response_case=response_case,
-        )
-
-        decorator = self._get_decorator(
-            path=path,
-            method="POST",
-            case_converters=converters,
             skip_finalizer=skip_finalizer,
             skip_preparer=skip_preparer,
         )
-        return decorator
 
     def patch(
             self,
@@ -593,24 +626,18 @@ class Router(IRouter):
         Raises:
             pydantic_core.ValidationError: If type validation of arguments fails.
         """
-        converters = CaseConverters(
-            self,
+        return self._route(
+            "PATCH",
+            path,
             default_case=default_case,
             query_case=query_case,
             body_case=body_case,
             cookie_case=cookie_case,
             header_case=header_case,
             response_case=response_case,
-        )
-
-        decorator = self._get_decorator(
-            path=path,
-            method="PATCH",
-            case_converters=converters,
             skip_finalizer=skip_finalizer,
             skip_preparer=skip_preparer,
         )
-        return decorator
 
     def put(
             self,
@@ -659,24 +686,18 @@ class Router(IRouter):
         Raises:
             pydantic_core.ValidationError: If type validation of arguments fails.
         """
-        converters = CaseConverters(
-            self,
+        return self._route(
+            "PUT",
+            path,
             default_case=default_case,
             query_case=query_case,
             body_case=body_case,
             cookie_case=cookie_case,
             header_case=header_case,
             response_case=response_case,
-        )
-
-        decorator = self._get_decorator(
-            path=path,
-            method="PUT",
-            case_converters=converters,
             skip_finalizer=skip_finalizer,
             skip_preparer=skip_preparer,
         )
-        return decorator
 
     def delete(
             self,
@@ -722,24 +743,17 @@ class Router(IRouter):
         Raises:
             pydantic_core.ValidationError: If type validation of arguments fails.
         """
-        converters = CaseConverters(
-            self,
+        return self._route(
+            "DELETE",
+            path,
             default_case=default_case,
             query_case=query_case,
-            body_case=None,
             cookie_case=cookie_case,
             header_case=header_case,
             response_case=response_case,
-        )
-
-        decorator = self._get_decorator(
-            path=path,
-            method="DELETE",
-            case_converters=converters,
             skip_finalizer=skip_finalizer,
             skip_preparer=skip_preparer,
         )
-        return decorator
 
     def head(
             self,
@@ -785,24 +799,17 @@ class Router(IRouter):
         Raises:
             pydantic_core.ValidationError: If type validation of arguments fails.
         """
-        converters = CaseConverters(
-            self,
+        return self._route(
+            "HEAD",
+            path,
             default_case=default_case,
             query_case=query_case,
-            body_case=None,
             cookie_case=cookie_case,
             header_case=header_case,
             response_case=response_case,
-        )
-
-        decorator = self._get_decorator(
-            path=path,
-            method="HEAD",
-            case_converters=converters,
             skip_finalizer=skip_finalizer,
             skip_preparer=skip_preparer,
         )
-        return decorator
 
     def options(
             self,
@@ -848,21 +855,14 @@ class Router(IRouter):
         Raises:
             pydantic_core.ValidationError: If type validation of arguments fails.
         """
-        converters = CaseConverters(
-            self,
+        return self._route(
+            "OPTIONS",
+            path,
             default_case=default_case,
             query_case=query_case,
-            body_case=None,
             cookie_case=cookie_case,
             header_case=header_case,
             response_case=response_case,
-        )
-
-        decorator = self._get_decorator(
-            path=path,
-            method="OPTIONS",
-            case_converters=converters,
             skip_finalizer=skip_finalizer,
             skip_preparer=skip_preparer,
         )
-        return decorator
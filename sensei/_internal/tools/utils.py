@@ -13,6 +13,8 @@ from .types import HTTPMethod, MethodType
 
 _T = TypeVar("_T")
 
+_http_methods: tuple[str, ...] = get_args(HTTPMethod)
+
 
 def make_model(
         model_name: str,
@@ -67,17 +69,18 @@ def accept_body(method: HTTPMethod) -> bool:
 
 
 def validate_method(method: HTTPMethod) -> bool:
-    methods = get_args(HTTPMethod)
-    if method not in methods:
+    if method not in _http_methods:
         raise ValueError(f'Invalid HTTP method "{method}". '
-                         f'Standard HTTP methods defined by the HTTP/1.1 protocol: {methods}')
+                         f'Standard HTTP methods defined by the HTTP/1.1 protocol: {_http_methods}')
     else:
         return True
 
 
 def args_to_kwargs(func: Callable, *args, **kwargs) -> OrderedDict[str, Any]:
-    sig = inspect.signature(func)
+    return bind_args(inspect.signature(func), *args, **kwargs)
+
 
+def bind_args(sig: inspect.Signature, /, *args, **kwargs) -> OrderedDict[str, Any]:
     bound_args = sig.bind_partial(*args, **kwargs)
 
     args = OrderedDict(bound_args.arguments)
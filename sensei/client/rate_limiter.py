@@ -104,9 +104,6 @@ class AsyncRateLimiter(_BaseLimiter):
         rate_limit (IRateLimit): An instance of RateLimit to share between limiters.
     """
 
-    def __init__(self, rate_limit: IRateLimit) -> None:
-        super().__init__(rate_limit)
-
     async def wait_for_slot(self) -> None:
         """Asynchronously wait until a slot becomes available by periodically acquiring a token."""
         await self._rate_limit.async_wait_for_slot()
@@ -120,9 +117,6 @@ class RateLimiter(_BaseLimiter):
         rate_limit (IRateLimit): An instance of RateLimit to share between limiters.
     """
 
-    def __init__(self, rate_limit: IRateLimit) -> None:
-        super().__init__(rate_limit)
-
     def wait_for_slot(self) -> None:
         """Synchronously wait until a slot becomes available by periodically acquiring a token."""
         self._rate_limit.wait_for_slot()
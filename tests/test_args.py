@@ -0,0 +1,34 @@
+from sensei import Args
+
+
+class TestArgs:
+    @staticmethod
+    def dump(args: Args) -> dict:
+        return args.model_dump(mode='json', exclude_none=True, by_alias=True)
+
+    def test_nested_none_pruning(self):
+        args = Args(
+            url='/users',
+            params={'a': None, 'b': {'c': None, 'd': {'e': None, 'f': 1}}, 'g': [None]},
+            headers={'h': 'v', 'x': None},
+            cookies={'k': {'l': None}},
+        )
+        dumped = self.dump(args)
+
+        assert dumped['params'] == {'b': {'d': {'f': 1}}, 'g': [None]}
+        assert dumped['headers'] == {'h': 'v'}
+        assert dumped['cookies'] == {'k': {}}
+        assert dumped['json'] == {}
+
+    def test_files_pruned(self):
+        files = {'a': None, 'b': {'c': None}}
+        dumped = self.dump(Args(url='/users', files=files))
+
+        assert dumped['files'] == {'b': {}}
+        assert files == {'a': None, 'b': {'c': None}}
+
+    def test_without_none(self):
+        dumped = self.dump(Args(url='/users', params={'a': {'b': 1}}, files={'c': {'d': 2}}))
+
+        assert dumped['params'] == {'a': {'b': 1}}
+        assert dumped['files'] == {'c': {'d': 2}}
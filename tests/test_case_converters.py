@@ -0,0 +1,50 @@
+import pytest
+
+from sensei import Router, camel_case, snake_case, kebab_case, header_case
+from sensei._internal._core._types import CaseConverters
+from sensei._internal.tools import identical
+
+
+class TestCaseConverters:
+    @pytest.fixture()
+    def router(self) -> Router:
+        return Router('https://example.com/api', body_case=snake_case)
+
+    def test_layers(self, router):
+        converters = CaseConverters(router, query_case=camel_case)
+
+        assert converters['query_case'] is camel_case
+        assert converters['body_case'] is snake_case
+        assert converters['header_case'] is header_case
+        assert converters['cookie_case'] is identical
+
+        converters.defaults = {'query_case': kebab_case, 'body_case': kebab_case, 'cookie_case': kebab_case}
+
+        assert converters['query_case'] is camel_case
+        assert converters['body_case'] is kebab_case
+        assert converters['cookie_case'] is kebab_case
+
+    def test_cache_invalidation(self, router):
+        converters = CaseConverters(router)
+        assert converters['query_case'] is identical
+
+        converters['query_case'] = camel_case
+        assert converters['query_case'] is camel_case
+
+        converters['default_case'] = kebab_case
+        assert converters['response_case'] is kebab_case
+
+        converters['query_case'] = None
+        assert converters['query_case'] is kebab_case
+
+        with pytest.raises(KeyError):
+            converters['unknown_case'] = camel_case
+
+    def test_defaults_read_only(self, router):
+        converters = CaseConverters(router)
+        assert converters['cookie_case'] is identical
+
+        with pytest.raises(TypeError):
+            converters.defaults['cookie_case'] = camel_case  # type: ignore
+
+        assert converters['cookie_case'] is identical
@@ -0,0 +1,53 @@
+from typing import Annotated
+
+import httpx
+import respx
+
+from sensei import Router, camel_case, kebab_case
+
+BASE_URL = 'https://example.com/api'
+
+
+class TestEndpointCache:
+    @respx.mock
+    def test_same_function_on_routers_with_different_cases(self):
+        route = respx.get(f'{BASE_URL}/users').mock(return_value=httpx.Response(200, json={}))
+
+        def get_users(page_size: int) -> dict: ...
+
+        camel = Router(BASE_URL, query_case=camel_case).get('/users')(get_users)
+        kebab = Router(BASE_URL, query_case=kebab_case).get('/users')(get_users)
+
+        camel(page_size=2)
+        kebab(page_size=2)
+        camel(page_size=3)
+
+        params = [dict(call.request.url.params) for call in route.calls]
+        assert params == [{'pageSize': '2'}, {'page-size': '2'}, {'pageSize': '3'}]
+
+    @respx.mock
+    def test_repeated_calls_reuse_route_state(self):
+        route = respx.get(f'{BASE_URL}/users/1').mock(return_value=httpx.Response(200, json={'id': 1}))
+        router = Router(BASE_URL)
+
+        @router.get('/users/{id_}')
+        def get_user(id_: int) -> dict: ...
+
+        assert [get_user(1) for _ in range(3)] == [{'id': 1}] * 3
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_unhashable_return_annotation(self):
+        route = respx.get(f'{BASE_URL}/users').mock(return_value=httpx.Response(200, json={'a': 1}))
+        router = Router(BASE_URL)
+
+        @router.get('/users')
+        def get_users() -> Annotated[dict, {'meta': 1}]: ...
+
+        @get_users.finalize
+        def _finalize(response) -> dict:
+            return response.json()
+
+        assert get_users() == {'a': 1}
+        assert get_users() == {'a': 1}
+        assert route.call_count == 2
@@ -0,0 +1,27 @@
+import weakref
+
+import pytest
+
+from sensei import Router
+from sensei._internal._core._types import IRouter
+
+
+class TestIRouter:
+    def test_incomplete_subclass(self):
+        with pytest.raises(TypeError, match='_route'):
+            class _Router(IRouter):
+                @property
+                def base_url(self):
+                    return None
+
+    def test_complete_subclass(self):
+        class _Router(Router):
+            pass
+
+        router = _Router('https://example.com/api')
+        assert isinstance(router, IRouter)
+        assert callable(router.get('/users'))
+
+    def test_router_weakref(self):
+        router = Router('https://example.com/api')
+        assert weakref.ref(router)() is router
@@ -0,0 +1,53 @@
+import httpx
+import respx
+
+from sensei import Router, snake_case
+
+BASE_URL = 'https://example.com/api'
+
+
+class TestResponse:
+    @respx.mock
+    def test_finalizer_response_type(self):
+        respx.get(f'{BASE_URL}/users').mock(return_value=httpx.Response(200, json={'userName': 'a'}))
+
+        plain = Router(BASE_URL)
+        hooked = Router(BASE_URL, response_case=snake_case, __finalize_json__=lambda json: json)
+        received = []
+
+        for router in (plain, hooked):
+            @router.get('/users')
+            def get_users() -> dict: ...
+
+            @get_users.finalize
+            def _finalize(response) -> dict:
+                received.append(response)
+                return response.json()
+
+            get_users()
+
+        assert len(received) == 2
+        assert type(received[0]) is type(received[1])
+        assert all(isinstance(response, httpx.Response) for response in received)
+        assert received[0].json() == {'userName': 'a'}
+        assert received[1].json() == {'user_name': 'a'}
+
+    @respx.mock
+    def test_json_decoding_matches_httpx(self):
+        big = 123456789012345678901234567890
+        respx.get(f'{BASE_URL}/big').mock(return_value=httpx.Response(200, json={'valueId': big}))
+        respx.get(f'{BASE_URL}/utf16').mock(return_value=httpx.Response(
+            200,
+            content='{"userName": "ü"}'.encode('utf-16'),
+            headers={'Content-Type': 'application/json; charset=utf-16'},
+        ))
+
+        for router in (Router(BASE_URL), Router(BASE_URL, response_case=snake_case)):
+            @router.get('/big')
+            def get_big() -> dict: ...
+
+            @router.get('/utf16')
+            def get_utf16() -> dict: ...
+
+            assert list(get_big().values()) == [big]
+            assert list(get_utf16().values()) == ['ü']
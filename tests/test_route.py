@@ -0,0 +1,35 @@
+import functools
+
+import httpx
+import respx
+
+from sensei import Router, APIModel
+
+BASE_URL = 'https://example.com/api'
+
+
+class TestRoute:
+    @respx.mock
+    def test_routed_staticmethod(self):
+        respx.get(f'{BASE_URL}/status').mock(return_value=httpx.Response(200, json={'a': 1}))
+        router = Router(BASE_URL)
+
+        class Model(APIModel):
+            @router.get('/status')
+            @staticmethod
+            def status() -> dict: ...
+
+        assert Model.status() == {'a': 1}
+
+    @respx.mock
+    def test_sync_wrapper_over_coroutine_function(self):
+        respx.get(f'{BASE_URL}/status').mock(return_value=httpx.Response(200, json={'a': 1}))
+        router = Router(BASE_URL)
+
+        async def status() -> dict: ...
+
+        @router.get('/status')
+        @functools.wraps(status)
+        def sync_status() -> dict: ...
+
+        assert sync_status() == {'a': 1}